@@ -6,8 +6,14 @@ should detect and flag appropriately.
 """
 
 import os
+import sys
+import itertools
 import logging
-from flask import Flask, request, jsonify, render_template_string
+import threading
+from collections import OrderedDict
+import orjson
+from flask import Flask, Response, request, jsonify, render_template_string
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
 # Configure logging
@@ -17,7 +23,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson for faster jsonify() and get_json()."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
 # Configuration from environment variables (secure practice)
@@ -26,42 +44,56 @@ app.config['DATABASE_URL'] = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
 app.config['DEBUG'] = os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
 
 
-# In-memory storage for demo (use a real database in production)
-items = []
+# In-memory storage for demo (use a real database in production).
+# Capped at MAX_ITEMS (at least 1); the oldest items are evicted first, and
+# items are listed in creation order. gunicorn serves requests from several
+# threads, so changes and full reads of the store hold _items_lock.
+MAX_ITEMS = max(1, int(os.environ.get('MAX_ITEMS', 10_000)))
+items = OrderedDict()
+_items_lock = threading.Lock()
+_next_id = itertools.count(1)
+
+
+# Static response bodies, serialized once at import time
+_INDEX_BODY = orjson.dumps({
+    'app': 'DevSecOps Demo API',
+    'version': '1.0.0',
+    'status': 'running',
+    'endpoints': {
+        'health': '/health',
+        'items': '/api/items',
+        'item': '/api/items/<id>'
+    }
+})
+
+_HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'checks': {
+        'app': 'ok',
+        'database': 'ok'  # In production, actually check DB connection
+    }
+})
 
 
 @app.route('/')
 def index():
     """Root endpoint with basic info."""
-    return jsonify({
-        'app': 'DevSecOps Demo API',
-        'version': '1.0.0',
-        'status': 'running',
-        'endpoints': {
-            'health': '/health',
-            'items': '/api/items',
-            'item': '/api/items/<id>'
-        }
-    })
+    return Response(_INDEX_BODY, mimetype='application/json')
 
 
 @app.route('/health')
 def health():
     """Health check endpoint for container orchestration."""
-    return jsonify({
-        'status': 'healthy',
-        'checks': {
-            'app': 'ok',
-            'database': 'ok'  # In production, actually check DB connection
-        }
-    })
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 
 @app.route('/api/items', methods=['GET'])
 def get_items():
     """Get all items."""
     logger.info('Fetching all items')
-    return jsonify({'items': items, 'count': len(items)})
+    with _items_lock:
+        snapshot = list(items.values())
+    return jsonify({'items': snapshot, 'count': len(snapshot)})
 
 
 @app.route('/api/items', methods=['POST'])
@@ -77,11 +109,16 @@ def create_item():
     description = data.get('description', '')[:500]
     
     item = {
-        'id': len(items) + 1,
+        'id': next(_next_id),
         'name': name,
         'description': description
     }
-    items.append(item)
+    with _items_lock:
+        items[item['id']] = item
+        evicted_id = items.popitem(last=False)[0] if len(items) > MAX_ITEMS else None
+    
+    if evicted_id is not None:
+        logger.info(f'Evicted item: {evicted_id}')
     
     logger.info(f'Created item: {item["id"]}')
     return jsonify(item), 201
@@ -90,7 +127,7 @@ def create_item():
 @app.route('/api/items/<int:item_id>', methods=['GET'])
 def get_item(item_id):
     """Get a specific item by ID."""
-    item = next((i for i in items if i['id'] == item_id), None)
+    item = items.get(item_id)
     
     if not item:
         return jsonify({'error': 'Item not found'}), 404
@@ -101,11 +138,10 @@ def get_item(item_id):
 @app.route('/api/items/<int:item_id>', methods=['DELETE'])
 def delete_item(item_id):
     """Delete an item by ID."""
-    global items
-    original_count = len(items)
-    items = [i for i in items if i['id'] != item_id]
+    with _items_lock:
+        removed = items.pop(item_id, None)
     
-    if len(items) == original_count:
+    if removed is None:
         return jsonify({'error': 'Item not found'}), 404
     
     logger.info(f'Deleted item: {item_id}')
@@ -133,5 +169,17 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
     debug = app.config['DEBUG']
     
-    logger.info(f'Starting application on port {port}')
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    if debug:
+        logger.info(f'Starting development server on port {port}')
+        app.run(host='0.0.0.0', port=port, debug=debug)
+    else:
+        # The Werkzeug dev server handles one request at a time; hand off to
+        # gunicorn with the same settings as the Dockerfile (gunicorn.conf.py)
+        app_dir = os.path.dirname(os.path.abspath(__file__))
+        logger.info(f'Starting gunicorn on port {port}')
+        os.execv(sys.executable, [
+            sys.executable, '-m', 'gunicorn',
+            '--config', os.path.join(app_dir, 'gunicorn.conf.py'),
+            '--chdir', app_dir,
+            'app:app',
+        ])
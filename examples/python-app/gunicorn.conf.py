@@ -0,0 +1,21 @@
+"""
+Gunicorn settings for the example app.
+
+Shared by the Dockerfile CMD and ``python app.py`` so both entrypoints
+serve the app the same way.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+# The in-memory item store lives in each worker process, so a single worker
+# keeps the demo API consistent; concurrency comes from threads instead.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+worker_class = 'gthread'
+threads = (os.cpu_count() or 1) * 2
+
+accesslog = '-'
+errorlog = '-'
+capture_output = True
+enable_stdio_inheritance = True
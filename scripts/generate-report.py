@@ -7,6 +7,7 @@ a comprehensive security report in various formats.
 
 Usage:
     python generate-report.py [--input-dir DIRECTORY] [--output FORMAT] [--output-file FILE]
+                              [--jobs N] [--min-severity SEVERITY]
 
 Example:
     python generate-report.py --input-dir ./security-reports --output html --output-file report.html
@@ -14,16 +15,90 @@ Example:
 
 import argparse
 import json
+import mmap
 import os
 import sys
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
-from dataclasses import dataclass, field, asdict
-from collections import defaultdict
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from dataclasses import dataclass, asdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib parser
+    orjson = None
 
-@dataclass
+try:
+    import ijson
+except ImportError:  # optional, SARIF files are loaded whole without it
+    ijson = None
+
+
+def load_json(filepath: Path) -> Any:
+    """Load a JSON document, using orjson when it is installed.
+
+    orjson parses straight from a read-only memory map of the file, which
+    avoids copying large SARIF files into a Python bytes object first.
+    """
+    with open(filepath, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and some filesystems cannot be mapped
+            return orjson.loads(f.read())
+
+        with mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+# SARIF files at least this large are streamed with ijson when it is installed.
+# Smaller files are faster to load whole, and their parsed tree fits easily
+# in memory.
+SARIF_STREAM_THRESHOLD = 64 * 1024 * 1024
+
+
+def iter_sarif_runs(filepath: Path):
+    """Yield ``(driver, results)`` for each run in a SARIF file.
+
+    Large files are streamed with ijson instead of being loaded whole: one
+    pass reads the tool drivers (small), a second yields the results one at
+    a time. Files with several runs are streamed a run at a time so each
+    result stays paired with its own driver.
+    """
+    if ijson is None or os.path.getsize(filepath) < SARIF_STREAM_THRESHOLD:
+        data = load_json(filepath)
+        for run in data.get('runs', []):
+            yield run.get('tool', {}).get('driver', {}), run.get('results', [])
+        return
+
+    with open(filepath, 'rb') as f:
+        drivers = list(ijson.items(f, 'runs.item.tool.driver', use_float=True))
+        f.seek(0)
+
+        if len(drivers) <= 1:
+            yield (drivers[0] if drivers else {}), ijson.items(f, 'runs.item.results.item', use_float=True)
+            return
+
+        for run in ijson.items(f, 'runs.item', use_float=True):
+            yield run.get('tool', {}).get('driver', {}), run.get('results', [])
+
+
+SARIF_LEVEL_SEVERITY = {'error': 'HIGH', 'warning': 'MEDIUM', 'note': 'LOW'}
+NPM_SEVERITY = {'critical': 'CRITICAL', 'high': 'HIGH', 'moderate': 'MEDIUM', 'low': 'LOW'}
+
+# CVSS score bands: bisect_right(CVSS_THRESHOLDS, score) indexes CVSS_SEVERITIES
+CVSS_THRESHOLDS = (4.0, 7.0, 9.0)
+CVSS_SEVERITIES = ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+
+
+@dataclass(slots=True)
 class Vulnerability:
     """Represents a security vulnerability finding."""
     id: str
@@ -36,10 +111,10 @@ class Vulnerability:
     cwe: str = ""
     cvss: float = 0.0
     remediation: str = ""
-    references: List[str] = field(default_factory=list)
+    references: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Represents results from a single scanner."""
     scanner: str
@@ -48,7 +123,7 @@ class ScanResult:
     summary: Dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityReport:
     """Aggregated security report."""
     generated_at: str
@@ -64,42 +139,51 @@ class ReportGenerator:
     """Generates security reports from scan results."""
 
     SEVERITY_ORDER = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO']
+    SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITY_ORDER)}
+
+    PARSERS = {
+        'sarif': 'parse_sarif',
+        'npm-audit': 'parse_npm_audit',
+        'trivy': 'parse_trivy_json',
+    }
 
-    def __init__(self, input_dir: str):
+    def __init__(self, input_dir: str, jobs: Optional[int] = None, min_severity: Optional[str] = None):
         self.input_dir = Path(input_dir)
+        self.jobs = jobs
+        # Known severities below --min-severity. Findings with a severity
+        # outside SEVERITY_ORDER (e.g. Trivy's UNKNOWN) are never skipped.
+        self.skip_severities = (
+            frozenset(self.SEVERITY_ORDER[self.SEVERITY_RANK[min_severity] + 1:]) if min_severity else frozenset()
+        )
         self.scan_results: List[ScanResult] = []
 
-    def parse_sarif(self, filepath: Path) -> List[Vulnerability]:
+    @staticmethod
+    def parse_sarif(filepath: Path, skip: FrozenSet[str] = frozenset()) -> List[Vulnerability]:
         """Parse SARIF format (Semgrep, Trivy, etc.)."""
         vulnerabilities = []
 
         try:
-            with open(filepath) as f:
-                data = json.load(f)
+            for driver, results in iter_sarif_runs(filepath):
+                tool_name = driver.get('name', 'Unknown')
+                rule_list = driver.get('rules', [])
+                rules = dict(zip(map(itemgetter('id'), rule_list), rule_list))
 
-            for run in data.get('runs', []):
-                tool_name = run.get('tool', {}).get('driver', {}).get('name', 'Unknown')
-                rules = {r['id']: r for r in run.get('tool', {}).get('driver', {}).get('rules', [])}
-
-                for result in run.get('results', []):
+                for result in results:
                     rule_id = result.get('ruleId', '')
                     rule = rules.get(rule_id, {})
 
                     level = result.get('level', 'warning')
-                    severity_map = {'error': 'HIGH', 'warning': 'MEDIUM', 'note': 'LOW'}
-                    severity = severity_map.get(level, 'MEDIUM')
+                    severity = SARIF_LEVEL_SEVERITY.get(level, 'MEDIUM')
 
                     props = rule.get('properties', {})
-                    if 'security-severity' in props:
-                        score = float(props['security-severity'])
-                        if score >= 9.0:
-                            severity = 'CRITICAL'
-                        elif score >= 7.0:
-                            severity = 'HIGH'
-                        elif score >= 4.0:
-                            severity = 'MEDIUM'
-                        else:
-                            severity = 'LOW'
+                    security_severity = props.get('security-severity')
+                    cvss = 0.0
+                    if security_severity is not None:
+                        cvss = float(security_severity)
+                        severity = CVSS_SEVERITIES[bisect_right(CVSS_THRESHOLDS, cvss)]
+
+                    if severity in skip:
+                        continue
 
                     locations = result.get('locations', [{}])
                     location = locations[0] if locations else {}
@@ -116,9 +200,9 @@ class ReportGenerator:
                         file_path=artifact_location.get('uri', ''),
                         line_number=region.get('startLine', 0),
                         cwe=props.get('cwe', ''),
-                        cvss=float(props.get('security-severity', 0)),
+                        cvss=cvss,
                         remediation=rule.get('help', {}).get('text', ''),
-                        references=[tag for tag in props.get('tags', []) if tag.startswith('http')]
+                        references=tuple(tag for tag in props.get('tags', ()) if tag.startswith('http'))
                     )
                     vulnerabilities.append(vuln)
 
@@ -127,27 +211,29 @@ class ReportGenerator:
 
         return vulnerabilities
 
-    def parse_npm_audit(self, filepath: Path) -> List[Vulnerability]:
+    @staticmethod
+    def parse_npm_audit(filepath: Path, skip: FrozenSet[str] = frozenset()) -> List[Vulnerability]:
         """Parse npm audit JSON output."""
         vulnerabilities = []
 
         try:
-            with open(filepath) as f:
-                data = json.load(f)
+            data = load_json(filepath)
 
             for vuln_id, vuln_data in data.get('vulnerabilities', {}).items():
-                severity_map = {'critical': 'CRITICAL', 'high': 'HIGH', 'moderate': 'MEDIUM', 'low': 'LOW'}
+                severity = NPM_SEVERITY.get(vuln_data.get('severity', ''), 'MEDIUM')
+                if severity in skip:
+                    continue
 
                 vuln = Vulnerability(
                     id=vuln_id,
                     title=vuln_data.get('name', vuln_id),
-                    severity=severity_map.get(vuln_data.get('severity', ''), 'MEDIUM'),
+                    severity=severity,
                     description=vuln_data.get('title', ''),
                     source='npm audit',
                     file_path='package.json',
                     remediation=vuln_data.get('fixAvailable', {}).get('name', '') if isinstance(
                         vuln_data.get('fixAvailable'), dict) else '',
-                    references=[vuln_data.get('url', '')]
+                    references=(vuln_data.get('url', ''),)
                 )
                 vulnerabilities.append(vuln)
 
@@ -156,28 +242,32 @@ class ReportGenerator:
 
         return vulnerabilities
 
-    def parse_trivy_json(self, filepath: Path) -> List[Vulnerability]:
+    @staticmethod
+    def parse_trivy_json(filepath: Path, skip: FrozenSet[str] = frozenset()) -> List[Vulnerability]:
         """Parse Trivy JSON output."""
         vulnerabilities = []
 
         try:
-            with open(filepath) as f:
-                data = json.load(f)
+            data = load_json(filepath)
 
             for result in data.get('Results', []):
                 target = result.get('Target', '')
 
                 for vuln_data in result.get('Vulnerabilities', []):
+                    severity = vuln_data.get('Severity', 'UNKNOWN').upper()
+                    if severity in skip:
+                        continue
+
                     vuln = Vulnerability(
                         id=vuln_data.get('VulnerabilityID', ''),
                         title=vuln_data.get('Title', vuln_data.get('VulnerabilityID', '')),
-                        severity=vuln_data.get('Severity', 'UNKNOWN').upper(),
+                        severity=severity,
                         description=vuln_data.get('Description', ''),
                         source='Trivy',
                         file_path=target,
                         cvss=vuln_data.get('CVSS', {}).get('nvd', {}).get('V3Score', 0),
                         remediation=f"Update {vuln_data.get('PkgName', '')} to {vuln_data.get('FixedVersion', 'N/A')}",
-                        references=vuln_data.get('References', [])[:3]
+                        references=tuple(vuln_data.get('References', [])[:3])
                     )
                     vulnerabilities.append(vuln)
 
@@ -186,64 +276,70 @@ class ReportGenerator:
 
         return vulnerabilities
 
+    def _find_scan_files(self) -> List[Tuple[str, Path]]:
+        """Walk the input directory once and return ``(kind, path)`` pairs."""
+        found: Dict[str, List[Path]] = {'sarif': [], 'npm-audit': [], 'trivy': []}
+
+        for path in self.input_dir.rglob('*'):
+            if path.suffix == '.sarif':
+                found['sarif'].append(path)
+            elif path.name == 'npm-audit.json':
+                found['npm-audit'].append(path)
+            elif path.name.startswith('trivy') and path.suffix == '.json':
+                found['trivy'].append(path)
+
+        return [(kind, path) for kind, paths in found.items() for path in paths]
+
+    @staticmethod
+    def _scanner_name(kind: str, path: Path) -> str:
+        """Name a scan result after the file it was parsed from."""
+        if kind == 'sarif':
+            return path.stem
+        if kind == 'trivy':
+            return 'trivy-' + path.stem
+        return kind
+
+    def _add_result(self, scanner: str, vulns: List[Vulnerability], timestamp: str):
+        """Record a scanner's findings along with their severity summary."""
+        if not vulns:
+            return
+
+        self.scan_results.append(ScanResult(
+            scanner=scanner,
+            timestamp=timestamp,
+            vulnerabilities=vulns,
+            summary=dict(Counter(v.severity for v in vulns))
+        ))
+
     def collect_results(self):
         """Collect all scan results from input directory."""
         if not self.input_dir.exists():
             print(f"Input directory {self.input_dir} does not exist", file=sys.stderr)
             return
 
-        for sarif_file in self.input_dir.rglob('*.sarif'):
-            vulns = self.parse_sarif(sarif_file)
-            if vulns:
-                summary = defaultdict(int)
-                for v in vulns:
-                    summary[v.severity] += 1
-
-                self.scan_results.append(ScanResult(
-                    scanner=sarif_file.stem,
-                    timestamp=datetime.now().isoformat(),
-                    vulnerabilities=vulns,
-                    summary=dict(summary)
-                ))
-
-        for npm_file in self.input_dir.rglob('npm-audit.json'):
-            vulns = self.parse_npm_audit(npm_file)
-            if vulns:
-                summary = defaultdict(int)
-                for v in vulns:
-                    summary[v.severity] += 1
-
-                self.scan_results.append(ScanResult(
-                    scanner='npm-audit',
-                    timestamp=datetime.now().isoformat(),
-                    vulnerabilities=vulns,
-                    summary=dict(summary)
-                ))
-
-        for trivy_file in self.input_dir.rglob('trivy*.json'):
-            if trivy_file.suffix == '.json':
-                vulns = self.parse_trivy_json(trivy_file)
-                if vulns:
-                    summary = defaultdict(int)
-                    for v in vulns:
-                        summary[v.severity] += 1
+        # All scanners collected in one run share the same timestamp
+        collected_at = datetime.now().isoformat()
+        scan_files = self._find_scan_files()
+        jobs = [(str(path), kind, self.skip_severities) for kind, path in scan_files]
+
+        if self.jobs == 1 or len(jobs) < 2:
+            parsed = list(map(_parse_dispatch, jobs))
+        else:
+            # Files are independent and parsing is CPU bound, so spread them
+            # over worker processes; map() keeps the original file order.
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                parsed = list(executor.map(_parse_dispatch, jobs))
 
-                    self.scan_results.append(ScanResult(
-                        scanner='trivy-' + trivy_file.stem,
-                        timestamp=datetime.now().isoformat(),
-                        vulnerabilities=vulns,
-                        summary=dict(summary)
-                    ))
+        for (kind, path), vulns in zip(scan_files, parsed):
+            self._add_result(self._scanner_name(kind, path), vulns, collected_at)
 
     def generate_report(self) -> SecurityReport:
         """Generate aggregated security report."""
-        total = defaultdict(int)
-
+        total = Counter()
         for result in self.scan_results:
-            for severity, count in result.summary.items():
-                total[severity] += count
+            total += result.summary
 
-        recommendations = self._generate_recommendations()
+        recommendations = self._generate_recommendations(total)
 
         return SecurityReport(
             generated_at=datetime.now().isoformat(),
@@ -255,11 +351,11 @@ class ReportGenerator:
             recommendations=recommendations
         )
 
-    def _generate_recommendations(self) -> List[str]:
-        """Generate recommendations based on findings."""
+    def _generate_recommendations(self, total: Dict[str, int]) -> List[str]:
+        """Generate recommendations based on findings and their severity totals."""
         recommendations = []
-        total_critical = sum(r.summary.get('CRITICAL', 0) for r in self.scan_results)
-        total_high = sum(r.summary.get('HIGH', 0) for r in self.scan_results)
+        total_critical = total.get('CRITICAL', 0)
+        total_high = total.get('HIGH', 0)
 
         if total_critical > 0:
             recommendations.append(
@@ -273,9 +369,9 @@ class ReportGenerator:
                 "Plan to remediate these within 7 days."
             )
 
-        scanners = [r.scanner for r in self.scan_results]
+        scanners = {r.scanner.lower() for r in self.scan_results}
 
-        if not any('semgrep' in s.lower() for s in scanners):
+        if not any('semgrep' in s for s in scanners):
             recommendations.append(
                 "Consider enabling SAST scanning with Semgrep for code analysis."
             )
@@ -290,16 +386,18 @@ class ReportGenerator:
 
     def output_json(self, report: SecurityReport) -> str:
         """Output report as JSON."""
-        def serialize(obj):
-            if hasattr(obj, '__dict__'):
-                return asdict(obj) if hasattr(obj, '__dataclass_fields__') else obj.__dict__
-            return str(obj)
-
-        return json.dumps(asdict(report), indent=2, default=serialize)
+        if orjson is not None:
+            # orjson encodes dataclasses directly, without an asdict() copy
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(asdict(report), indent=2)
 
     def output_markdown(self, report: SecurityReport) -> str:
         """Output report as Markdown."""
-        lines = [
+        return "\n".join(self._markdown_lines(report))
+
+    def _markdown_lines(self, report: SecurityReport):
+        """Yield the lines of the Markdown report."""
+        yield from (
             "# Security Scan Report",
             "",
             f"**Generated:** {report.generated_at}",
@@ -311,51 +409,59 @@ class ReportGenerator:
             "",
             "| Severity | Count |",
             "|----------|-------|",
-        ]
+        )
 
         for severity in self.SEVERITY_ORDER:
             count = report.total_vulnerabilities.get(severity, 0)
-            lines.append(f"| {severity} | {count} |")
+            yield f"| {severity} | {count} |"
 
-        lines.extend(["", "## Recommendations", ""])
+        yield from ("", "## Recommendations", "")
 
         for rec in report.recommendations:
-            lines.append(f"- {rec}")
+            yield f"- {rec}"
 
-        lines.extend(["", "## Detailed Findings", ""])
+        yield from ("", "## Detailed Findings", "")
 
         for result in report.scan_results:
-            lines.append(f"### {result.scanner}")
-            lines.append("")
+            yield f"### {result.scanner}\n"
 
             if not result.vulnerabilities:
-                lines.append("No vulnerabilities found.")
-                lines.append("")
+                yield "No vulnerabilities found.\n"
                 continue
 
-            by_severity = defaultdict(list)
+            # Bucket by rank; severities outside SEVERITY_ORDER are not listed
+            by_rank = [[] for _ in self.SEVERITY_ORDER]
             for vuln in result.vulnerabilities:
-                by_severity[vuln.severity].append(vuln)
+                rank = self.SEVERITY_RANK.get(vuln.severity)
+                if rank is not None:
+                    by_rank[rank].append(vuln)
 
-            for severity in self.SEVERITY_ORDER:
-                vulns = by_severity.get(severity, [])
+            for severity, vulns in zip(self.SEVERITY_ORDER, by_rank):
                 if vulns:
-                    lines.append(f"#### {severity} ({len(vulns)})")
-                    lines.append("")
+                    yield f"#### {severity} ({len(vulns)})\n"
 
                     for vuln in vulns[:10]:
-                        lines.append(f"- **{vuln.title}** ({vuln.id})")
-                        if vuln.file_path:
-                            lines.append(f"  - File: `{vuln.file_path}`:{vuln.line_number}")
-                        if vuln.remediation:
-                            lines.append(f"  - Fix: {vuln.remediation[:100]}")
-                        lines.append("")
+                        file_line = f"\n  - File: `{vuln.file_path}`:{vuln.line_number}" if vuln.file_path else ""
+                        fix_line = f"\n  - Fix: {vuln.remediation[:100]}" if vuln.remediation else ""
+                        yield f"- **{vuln.title}** ({vuln.id}){file_line}{fix_line}\n"
 
                     if len(vulns) > 10:
-                        lines.append(f"  *...and {len(vulns) - 10} more*")
-                        lines.append("")
+                        yield f"  *...and {len(vulns) - 10} more*\n"
+
+
+def _parse_dispatch(job: Tuple[str, str, FrozenSet[str]]) -> List[Vulnerability]:
+    """Parse a single ``(path, kind, skip)`` scan file; picklable for worker processes."""
+    path, kind, skip = job
+    parser = getattr(ReportGenerator, ReportGenerator.PARSERS[kind])
+    return parser(Path(path), skip)
+
 
-        return "\n".join(lines)
+def positive_int(value: str) -> int:
+    """argparse type for options that need an integer of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
 
 
 def main():
@@ -365,10 +471,14 @@ def main():
     parser.add_argument('--output', '-o', choices=['json', 'markdown', 'html'],
                         default='markdown', help='Output format')
     parser.add_argument('--output-file', '-f', help='Output file path')
+    parser.add_argument('--jobs', '-j', type=positive_int, default=None,
+                        help='Worker processes for parsing scan files (default: CPU count)')
+    parser.add_argument('--min-severity', type=str.upper, choices=ReportGenerator.SEVERITY_ORDER,
+                        help='Skip findings below this severity (unscored findings are kept)')
 
     args = parser.parse_args()
 
-    generator = ReportGenerator(args.input_dir)
+    generator = ReportGenerator(args.input_dir, jobs=args.jobs, min_severity=args.min_severity)
     generator.collect_results()
 
     if not generator.scan_results: